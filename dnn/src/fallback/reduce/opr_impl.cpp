@@ -24,8 +24,40 @@ namespace {
 
 using namespace megdnn;
 
-template <typename Op>
-void reduce_exec_C1(size_t A, size_t B, Op op) MEGDNN_NOEXCEPT {
+/*!
+ * \brief reduce the contiguous range [bl, br) starting at offset
+ *
+ * NACC independent accumulators are used so that consecutive applies do not
+ * depend on each other, which hides the latency of the add/max instructions
+ * instead of serializing the whole row on a single accumulator.
+ */
+template <size_t NACC, typename Op>
+typename Op::wtype reduce_contig_range(Op& op, size_t offset, size_t bl,
+                                       size_t br) MEGDNN_NOEXCEPT {
+    using wtype = typename Op::wtype;
+    wtype res[NACC];
+    for (size_t i = 0; i < NACC; ++i) {
+        res[i] = op.INIT;
+    }
+    size_t b = bl;
+    for (; b + NACC <= br; b += NACC) {
+        for (size_t i = 0; i < NACC; ++i) {
+            res[i] = op.apply(res[i], op.read(offset + b + i));
+        }
+    }
+    for (; b < br; ++b) {
+        res[0] = op.apply(res[0], op.read(offset + b));
+    }
+    for (size_t step = 1; step < NACC; step *= 2) {
+        for (size_t i = 0; i + step < NACC; i += 2 * step) {
+            res[i] = op.apply(res[i], res[i + step]);
+        }
+    }
+    return res[0];
+}
+
+template <size_t NACC, typename Op>
+void reduce_exec_C1_impl(size_t A, size_t B, Op& op) MEGDNN_NOEXCEPT {
     using wtype = typename Op::wtype;
     rep(a, A) {
         std::function<wtype(size_t, size_t)> func;
@@ -34,11 +66,7 @@ void reduce_exec_C1(size_t A, size_t B, Op op) MEGDNN_NOEXCEPT {
                 size_t mid = bl + (br - bl) / 2;
                 return op.apply(func(bl, mid), func(mid, br));
             } else {
-                wtype res = op.INIT;
-                for (size_t b = bl; b < br; ++b) {
-                    res = op.apply(res, op.read(a * B + b));
-                }
-                return res;
+                return reduce_contig_range<NACC>(op, a * B, bl, br);
             }
         };
         wtype res = func(0, B);
@@ -46,6 +74,17 @@ void reduce_exec_C1(size_t A, size_t B, Op op) MEGDNN_NOEXCEPT {
     }
 }
 
+template <typename Op>
+void reduce_exec_C1(size_t A, size_t B, Op op) MEGDNN_NOEXCEPT {
+    //! long rows, e.g. softmax over a vocabulary, keep more applies in flight;
+    //! short rows would mostly run the remainder loop with 8 accumulators
+    if (B >= 1024) {
+        reduce_exec_C1_impl<8>(A, B, op);
+    } else {
+        reduce_exec_C1_impl<4>(A, B, op);
+    }
+}
+
 template <typename Op>
 void reduce_exec(size_t A, size_t B, size_t C, Op op) MEGDNN_NOEXCEPT {
     using wtype = typename Op::wtype;
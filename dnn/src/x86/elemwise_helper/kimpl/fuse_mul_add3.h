@@ -68,6 +68,14 @@ struct FuseMulAdd3Op;
             return {{vitem0, vitem1}};                                        \
         }                                                                     \
         MEGDNN_ATTRIBUTE_TARGET(_simd_target)                                 \
+        void operator()(const _simd_data_type& src0,                          \
+                        const _simd_data_type& src1,                          \
+                        const _simd_data_type& src2, _ctype* dst) const {     \
+            _##_func_prefix##_storeu_##_func_suffix2(                         \
+                    reinterpret_cast<_ptr_type*>(dst),                        \
+                    operator()(src0, src1, src2));                            \
+        }                                                                     \
+        MEGDNN_ATTRIBUTE_TARGET(_simd_target)                                 \
         _simd_data_type operator()(const _simd_data_type& src0,               \
                                    const _simd_data_type& src1,               \
                                    const _simd_data_type& src2) const {       \
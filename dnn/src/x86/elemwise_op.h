@@ -691,6 +691,14 @@ struct OpCallerTernary<Op, SIMDType::NONE, BCAST101_VEC_BCAST101> {
                         src2 += Op::SIMD_WIDTH * 2;                           \
                         dst += Op::SIMD_WIDTH * 2;                            \
                     }                                                         \
+                    /* small spatial sizes (e.g. 3x3) fit in one vector */    \
+                    for (; i + Op::SIMD_WIDTH <= channel_stride;              \
+                         i += Op::SIMD_WIDTH) {                               \
+                        op(vis0(src0), src1_simd, vis2(src2), dst);           \
+                        src0 += Op::SIMD_WIDTH;                               \
+                        src2 += Op::SIMD_WIDTH;                               \
+                        dst += Op::SIMD_WIDTH;                                \
+                    }                                                         \
                     for (; i < channel_stride; i++) {                         \
                         op(*src0, *src1_ptr, *src2, dst);                     \
                         src0++;                                               \
@@ -187,7 +187,14 @@ TEST_F(X86, ELEMWISE_FORWARD_BINARY) {
             .execs({{1, 2, 1}, {1, 2, 2}, {1, 2, 1}, {}});              \
     checker.set_param(Mode::_optr)                                      \
             .execs({{1, 2, 2}, {1, 2, 2}, {1, 1, 1}, {}});              \
-    checker.set_param(Mode::_optr).execs({{3, 4, 1}, {3, 4, 1}, {3, 4, 1}, {}});
+    checker.set_param(Mode::_optr)                                      \
+            .execs({{3, 4, 1}, {3, 4, 1}, {3, 4, 1}, {}});              \
+    checker.set_param(Mode::_optr)                                      \
+            .execs({{2, 3, 9}, {1, 3, 1}, {2, 3, 9}, {}});              \
+    checker.set_param(Mode::_optr)                                      \
+            .execs({{2, 3, 12}, {1, 3, 1}, {2, 3, 12}, {}});            \
+    checker.set_param(Mode::_optr)                                      \
+            .execs({{2, 3, 40}, {1, 3, 1}, {2, 3, 40}, {}});
 
 #define BUILD_TERNARY_COMPLATE_TEST_CASE \
     TERNARY_COMPLATE_TEST_CASE(FUSE_MUL_ADD3)
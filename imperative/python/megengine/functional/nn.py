@@ -10,6 +10,8 @@
 from functools import lru_cache
 from typing import NamedTuple, Optional, Sequence, Tuple, Union
 
+import numpy as np
+
 from ..core._imperative_rt.core2 import apply, dtype_promotion
 from ..core._imperative_rt.ops import SubgraphBuilder as _SubgraphBuilder
 from ..core.ops import builtin
@@ -25,7 +27,9 @@ from ..core.ops.builtin import (
 from ..core.ops.special import Const
 from ..core.tensor import amp, megbrain_graph
 from ..core.tensor.array_method import _elwise_apply
+from ..core.tensor.dtype import is_bfloat16, is_quantize
 from ..core.tensor.utils import (
+    _normalize_axis,
     astensor1d,
     astype,
     cast_tensors,
@@ -43,9 +47,9 @@ from ..utils.deprecation import deprecated_func
 from ..utils.tuple_function import _pair, _pair_nonzero, _triple, _triple_nonzero
 from .debug_param import get_execution_strategy
 from .distributed import all_reduce_sum
-from .elemwise import _elwise, exp, log, log1p, maximum, minimum
+from .elemwise import _elemwise_multi_type, _elwise, exp, log, log1p, maximum, minimum
 from .math import matmul, max, sum
-from .tensor import broadcast_to, concat, expand_dims, ones, squeeze, zeros
+from .tensor import broadcast_to, concat, expand_dims, ones, ones_like, squeeze, zeros
 
 __all__ = [
     "adaptive_avg_pool2d",
@@ -788,6 +792,10 @@ def hsigmoid(x):
 
 def relu(x):
     r"""Element-wise `max(x, 0)`."""
+    if hasattr(x, "dtype") and is_quantize(x.dtype):
+        # relu keeps the quantization params, so it is computed directly on
+        # the quantized values instead of falling back to the float kernel
+        return _elemwise_multi_type(x, mode="qrelu", dtype=x.dtype)
     return _elwise(x, mode=Elemwise.Mode.RELU)
 
 
@@ -801,7 +809,12 @@ def prelu(inp: Tensor, weight: Tensor) -> Tensor:
 
     Refer to :class:`~.PReLU` for more information.
     """
-    return maximum(inp, 0) + weight * minimum(inp, 0)
+    # min(x, 0) and max(x, 0) share the same layout, so FUSE_MUL_ADD3 runs as one
+    # kernel broadcasting the (per-channel) weight instead of materializing
+    # weight * min(x, 0) as a temporary
+    return _elwise(
+        minimum(inp, 0), weight, maximum(inp, 0), mode=Elemwise.Mode.FUSE_MUL_ADD3
+    )
 
 
 def leaky_relu(inp: Tensor, negative_slope: float = 0.01) -> Tensor:
@@ -809,6 +822,15 @@ def leaky_relu(inp: Tensor, negative_slope: float = 0.01) -> Tensor:
 
     Refer to :class:`~.LeakyReLU` for more information.
     """
+    if isinstance(negative_slope, Tensor):
+        return maximum(inp, 0) + negative_slope * minimum(inp, 0)
+    if negative_slope == 0:
+        return relu(inp)
+    if 0 < negative_slope < 1:
+        # max(x, a * x) equals the definition for 0 < a < 1, which is one
+        # multiply and one max instead of max, min, multiply and add; a == 1 is
+        # excluded since every element would tie and MAX passes the gradient to both
+        return maximum(inp, negative_slope * inp)
     return maximum(inp, 0) + negative_slope * minimum(inp, 0)
 
 
@@ -817,25 +839,92 @@ def silu(x):
     return _elwise(x, mode=Elemwise.Mode.SILU)
 
 
-def gelu(x):
+def _is_half_dtype(dtype) -> bool:
+    return is_bfloat16(dtype) or dtype == "float16"
+
+
+def _get_compute_dtype(dtype):
+    # half precision tensors are loaded and stored as is, but transcendental
+    # functions and reductions inside fused subgraphs are evaluated in float32,
+    # and non-float tensors are promoted to float32 like in elemwise
+    if _is_half_dtype(dtype) or not np.issubdtype(dtype, np.floating):
+        return "float32"
+    return dtype
+
+
+def _get_result_dtype(dtype):
+    # under autocast the output is promoted like the elemwise ops it replaces,
+    # otherwise half precision inputs keep half precision outputs
+    if amp._enabled:
+        return amp._high_prec_dtype
+    return dtype if _is_half_dtype(dtype) else _get_compute_dtype(dtype)
+
+
+def _typecvt_if_needed(f, var, src_dtype, dst_dtype):
+    if src_dtype == dst_dtype:
+        return var
+    return f(TypeCvt(dtype=dst_dtype), var)
+
+
+@lru_cache(maxsize=None)
+def _get_gelu_tanh(device, dtype, result_dtype, gopt_level=2):
+    compute_dtype = _get_compute_dtype(dtype)
+
+    @subgraph("GeluTanh", compute_dtype, device, 1, gopt_level=gopt_level)
+    def gelu_tanh(inputs, f, c):
+        (inp,) = inputs
+        inp = _typecvt_if_needed(f, inp, dtype, compute_dtype)
+        # sqrt(2 / pi) * (x + 0.044715 * x^3)
+        inner = f(
+            "*",
+            f("fma3", f("*", inp, inp), c(0.044715), c(1)),
+            f("*", inp, c(0.7978845608028654)),
+        )
+        oup = f("*", f("*", inp, c(0.5)), f("+", f(Elemwise(mode="tanh"), inner), c(1)))
+        oup = _typecvt_if_needed(f, oup, compute_dtype, result_dtype)
+        return (oup,), (True,)
+
+    # build the op once, so that each call only pays for the cache lookup
+    return gelu_tanh()
+
+
+def gelu(x, approximate: str = "none"):
     r"""Applies the element-wise function:
 
     .. math::
         \text{gelu}(x) = x\Phi(x)
 
     where :math:`\Phi(x)` is the Cumulative Distribution Function for Gaussian Distribution.
+
+    When ``approximate`` is ``"tanh"``, :math:`\Phi(x)` is estimated with:
+
+    .. math::
+        \text{gelu}(x) = 0.5x(1 + \tanh(\sqrt{2 / \pi}(x + 0.044715x^3)))
+
+    Args:
+        x: input tensor.
+        approximate: the approximation to use, ``"none"`` or ``"tanh"``. Default: "none"
     """
-    return _elwise(x, mode=Elemwise.Mode.GELU)
+    assert approximate in {"none", "tanh"}, "unknown approximate: {}".format(
+        approximate
+    )
+    if approximate == "none":
+        return _elwise(x, mode=Elemwise.Mode.GELU)
+    gelu_tanh = _get_gelu_tanh(x.device, x.dtype, _get_result_dtype(x.dtype))
+    (oup,) = apply(gelu_tanh, x)
+    return oup
 
 def elu(inp: Tensor, alpha: float = 1.0) -> Tensor:
     r"""Applies the element-wise function:
 
     .. math::
-        \text{ELU}(x) = \max(0,x) + \min(0, \alpha * (\exp(x) - 1)).
+        \text{ELU}(x) = \max(0,x) + \alpha * (\exp(\min(0,x)) - 1).
 
     Refer to :class:`~.ELU` for more information.
     """
-    return maximum(inp, 0) + minimum(alpha * (exp(inp) - 1), 0)
+    # clamp before exp so that it never overflows and positive inputs get a zero
+    # (rather than nan) gradient from the exponential branch
+    return maximum(inp, 0) + alpha * (exp(minimum(inp, 0)) - 1)
 
 def softplus(inp: Tensor) -> Tensor:
     r"""Applies the element-wise function:
@@ -1027,10 +1116,41 @@ def softmax(inp: Tensor, axis: Optional[int] = None) -> Tensor:
     """
     if axis is None:
         axis = _get_softmax_axis(len(inp.shape))
-    offset = inp.max(axis=axis, keepdims=True).detach()
-    cached = exp(inp - offset)
-    down = sum(cached, axis=axis, keepdims=True)
-    return cached / down
+    return _softmax(inp, axis)
+
+
+@lru_cache(maxsize=None)
+def _get_softmax(device, dtype, result_dtype, axis, gopt_level=2):
+    compute_dtype = _get_compute_dtype(dtype)
+
+    @subgraph("Softmax", compute_dtype, device, 2, gopt_level=gopt_level)
+    def softmax(inputs, f, c):
+        inp, offset = inputs
+        inp = _typecvt_if_needed(f, inp, dtype, compute_dtype)
+        offset = _typecvt_if_needed(f, offset, dtype, compute_dtype)
+        # first pass: exp(x - max) lies in (0, 1], so it is stored once and reused
+        # as the numerator instead of being recomputed
+        cached = f(Elemwise(mode="exp"), f("-", inp, offset))
+        down = f(Reduce(mode="sum", axis=axis), cached)
+        # second pass: one reciprocal per row and a multiply per element
+        oup = f("*", cached, f("/", c(1), down))
+        oup = _typecvt_if_needed(f, oup, compute_dtype, result_dtype)
+        return (oup,), (True,)
+
+    return softmax()
+
+
+def _softmax(inp: Tensor, axis: int) -> Tensor:
+    ndim = inp.ndim
+    if ndim == 0:
+        return ones_like(inp).astype(_get_result_dtype(inp.dtype))
+    axis = _normalize_axis(ndim, axis)
+    # the row max only shifts the exponent for stability, the output does not
+    # depend on it, so it is computed outside the subgraph and kept out of backward
+    offset = max(inp.detach(), axis, keepdims=True)
+    op = _get_softmax(inp.device, inp.dtype, _get_result_dtype(inp.dtype), axis)
+    (oup,) = apply(op, inp, offset)
+    return oup
 
 
 @lru_cache(maxsize=None)
@@ -6,9 +6,19 @@
 # Unless required by applicable law or agreed to in writing,
 # software distributed under the License is distributed on an
 # "AS IS" BASIS, WITHOUT ARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-import numpy as np
-
-from ..functional import gelu, leaky_relu, prelu, relu, sigmoid, silu, softmax, elu
+from ..functional import (
+    elu,
+    full,
+    gelu,
+    leaky_relu,
+    prelu,
+    relu,
+    sigmoid,
+    silu,
+    softmax,
+)
+from ..functional.nn import _is_half_dtype
+from ..jit.tracing import is_tracing
 from ..tensor import Parameter
 from .module import Module
 
@@ -47,6 +57,8 @@ class Softmax(Module):
             [0.011656 0.031685 0.086129 0.234122 0.636409]
     """
 
+    ACTIVATION_KIND = "softmax"
+
     def __init__(self, axis=None, **kwargs):
         super().__init__(**kwargs)
         self.axis = axis
@@ -55,7 +67,7 @@ class Softmax(Module):
         return softmax(inputs, self.axis)
 
     def _module_info_string(self) -> str:
-        return "axis={axis}".format(axis=self.axis)
+        return "axis={}".format(self.axis)
 
 
 class Sigmoid(Module):
@@ -86,6 +98,8 @@ class Sigmoid(Module):
             [0.119203 0.268941 0.5      0.731059 0.880797]
     """
 
+    ACTIVATION_KIND = "sigmoid"
+
     def forward(self, inputs):
         return sigmoid(inputs)
 
@@ -118,6 +132,8 @@ class SiLU(Module):
             [-0.238406 -0.268941  0.        0.731059  1.761594]
     """
 
+    ACTIVATION_KIND = "silu"
+
     def forward(self, inputs):
         return silu(inputs)
 
@@ -130,6 +146,12 @@ class GELU(Module):
 
     where :math:`\Phi(x)` is the Cumulative Distribution Function for Gaussian Distribution.
 
+    Args:
+        approximate: the approximation used for :math:`\Phi(x)`. ``"none"`` evaluates
+            the exact erf-based formulation, ``"tanh"`` uses the cheaper
+            :math:`0.5(1 + \tanh(\sqrt{2 / \pi}(x + 0.044715x^3)))` estimation.
+            Default: "none"
+
     Examples:
 
         .. testcode::
@@ -151,8 +173,21 @@ class GELU(Module):
             [-0.0455 -0.1587  0.      0.8413  1.9545]
     """
 
+    ACTIVATION_KIND = "gelu"
+    approximate = "none"
+
+    def __init__(self, approximate: str = "none", **kwargs):
+        super().__init__(**kwargs)
+        assert approximate in {"none", "tanh"}, "unknown approximate: {}".format(
+            approximate
+        )
+        self.approximate = approximate
+
     def forward(self, inputs):
-        return gelu(inputs)
+        return gelu(inputs, self.approximate)
+
+    def _module_info_string(self) -> str:
+        return "approximate={}".format(self.approximate)
 
 
 class ReLU(Module):
@@ -181,6 +216,8 @@ class ReLU(Module):
             [0. 0. 0. 1. 2.]
     """
 
+    ACTIVATION_KIND = "relu"
+
     def forward(self, x):
         return relu(x)
 
@@ -227,25 +264,39 @@ class PReLU(Module):
             [-0.3   -0.925  2.7  ]
     """
 
+    ACTIVATION_KIND = "prelu"
+    _shape_checked = False
+
     def __init__(self, num_parameters: int = 1, init: float = 0.25, **kwargs):
         super().__init__(**kwargs)
         self.num_parameters = num_parameters
         if num_parameters > 1:
             # Assume format is NCHW
-            self.weight = Parameter(
-                data=np.full((1, num_parameters, 1, 1), init, dtype=np.float32)
-            )
+            self.weight = Parameter(full((1, num_parameters, 1, 1), init))
         else:
-            self.weight = Parameter(data=[init])
+            self.weight = Parameter(full((1,), init))
 
-    def forward(self, inputs):
-        assert self.weight.shape == (1,) or self.weight.shape == (
+    def _validate(self, inputs):
+        weight_shape = self.weight._tuple_shape
+        assert weight_shape == (1,) or weight_shape == (
             1,
             int(inputs.shape[1]),
             1,
             1,
         ), "invalid weight's shape"
-        return prelu(inputs, self.weight)
+
+    def forward(self, inputs):
+        # the weight's shape is fixed after construction, so it only needs to be
+        # checked against the first eager input
+        if not self._shape_checked and not is_tracing():
+            self._validate(inputs)
+            self._shape_checked = True
+        weight = self.weight
+        if weight.dtype != inputs.dtype and _is_half_dtype(inputs.dtype):
+            # casting the few weights is much cheaper than promoting the whole
+            # half precision output to float32
+            weight = weight.astype(inputs.dtype)
+        return prelu(inputs, weight)
 
 
 class LeakyReLU(Module):
@@ -263,6 +314,9 @@ class LeakyReLU(Module):
         negative\_slope \times x, & \text{ otherwise }
         \end{cases}
 
+    Args:
+        negative_slope: the slope applied to negative inputs. Default: 0.01
+
     Examples:
 
         .. testcode::
@@ -283,6 +337,8 @@ class LeakyReLU(Module):
             [-0.08 -0.12  6.   10.  ]
     """
 
+    ACTIVATION_KIND = "leaky_relu"
+
     def __init__(self, negative_slope: float = 0.01, **kwargs):
         super().__init__(**kwargs)
         self.negative_slope = negative_slope
@@ -322,6 +378,8 @@ class ELU(Module):
             [-0.864664 -0.632120 0.       1.       2.      ]
     """
 
+    ACTIVATION_KIND = "elu"
+
     def __init__(self, alpha: float = 1., **kwargs):
         super().__init__(**kwargs)
         self.alpha = alpha
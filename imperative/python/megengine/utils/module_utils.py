@@ -8,7 +8,7 @@
 import contextlib
 from collections import Iterable
 
-from ..module import Sequential
+from ..module import Conv2d, ConvRelu2d, Sequential
 from ..module.module import Module, _access_structure
 from ..tensor import Tensor
 
@@ -70,3 +70,65 @@ def set_module_mode_safe(
     recursive_backup_stats(module, mode=training)
     yield module
     recursive_recover_stats(module)
+
+
+_conv_activation_fusion_map = {(Conv2d, "relu"): ConvRelu2d}
+
+
+def _fuse_conv_activation(conv: Conv2d, fused_type):
+    fused = fused_type(
+        conv.in_channels,
+        conv.out_channels,
+        conv.kernel_size,
+        conv.stride,
+        conv.padding,
+        conv.dilation,
+        conv.groups,
+        conv.bias is not None,
+        conv.conv_mode,
+        conv.compute_mode,
+        name=conv.name,
+    )
+    fused.weight = conv.weight
+    fused.bias = conv.bias
+    fused.training = conv.training
+    return fused
+
+
+def _has_forward_hooks(module: Module) -> bool:
+    return bool(module._forward_pre_hooks or module._forward_hooks)
+
+
+def fuse_activation(module: Module) -> Module:
+    r"""Fuses a producer module followed by an activation module inside every
+    :class:`~.Sequential` of ``module`` into the corresponding fused module,
+    e.g. :class:`~.module.Conv2d` followed by :class:`~.module.ReLU` is replaced
+    by :class:`~.module.ConvRelu2d`. The activation is recognized by its
+    ``ACTIVATION_KIND`` and removed from the container, keys of the other layers
+    remain unchanged. Parameters are shared with the original producer module.
+    Pairs where either module has forward hooks or forward pre-hooks registered
+    are left unfused, as the hooks could not be called at the same points.
+
+    Args:
+        module: root module to be fused inplace.
+
+    Returns:
+        the root module.
+    """
+    for seq in list(module.modules()):
+        if not isinstance(seq, Sequential):
+            continue
+        idx = 0
+        while idx < len(seq) - 1:
+            producer, activation = seq[idx], seq[idx + 1]
+            kind = getattr(activation, "ACTIVATION_KIND", None)
+            fused_type = _conv_activation_fusion_map.get((type(producer), kind))
+            if (
+                fused_type is not None
+                and not _has_forward_hooks(producer)
+                and not _has_forward_hooks(activation)
+            ):
+                seq[idx] = _fuse_conv_activation(producer, fused_type)
+                del seq[idx + 1]
+            idx += 1
+    return module
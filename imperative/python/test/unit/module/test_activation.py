@@ -9,7 +9,10 @@
 import numpy as np
 
 import megengine as mge
-from megengine.module import LeakyReLU, ELU
+from megengine import amp
+from megengine.autodiff import GradManager
+from megengine.core.tensor import dtype
+from megengine.module import ELU, GELU, LeakyReLU, PReLU, ReLU, SiLU, Softmax
 
 
 def test_leaky_relu():
@@ -22,6 +25,16 @@ def test_leaky_relu():
     np_output = np.maximum(0, data) + negative_slope * np.minimum(0, data)
     np.testing.assert_equal(output.numpy(), np_output)
 
+    for negative_slope in [0, 0.5, 1, 2, -0.5]:
+        inp = mge.tensor(data)
+        with GradManager().attach(inp) as gm:
+            output = LeakyReLU(negative_slope)(inp)
+            gm.backward(output, mge.tensor(np.ones_like(data)))
+        np_output = np.maximum(0, data) + negative_slope * np.minimum(0, data)
+        np.testing.assert_allclose(output.numpy(), np_output, rtol=1e-6)
+        np_grad = np.where(data > 0, 1, negative_slope).astype(np.float32)
+        np.testing.assert_allclose(inp.grad.numpy(), np_grad, rtol=1e-6)
+
 def test_elu():
     data = np.array([-2,-1,0,1,2]).astype(np.float32)
     alpha = 1.0
@@ -31,3 +44,173 @@ def test_elu():
 
     np_output = np.maximum(0, data) + np.minimum(0, alpha * (np.exp(data) - 1))
     np.testing.assert_equal(output.numpy(), np_output)
+
+
+def test_elu_large_input_grad():
+    data = mge.tensor(np.array([-2, 100, 1000]).astype(np.float32))
+
+    elu = ELU(0.5)
+    with GradManager().attach(data) as gm:
+        output = elu(data)
+        gm.backward(output.sum())
+
+    np.testing.assert_allclose(
+        output.numpy(), [0.5 * (np.exp(-2) - 1), 100, 1000], rtol=1e-6
+    )
+    np.testing.assert_allclose(data.grad.numpy(), [0.5 * np.exp(-2), 1, 1], rtol=1e-6)
+
+
+def test_gelu_tanh():
+    data = np.array([-3, -2, -1, -0.5, 0, 0.5, 1, 2, 3]).astype(np.float32)
+
+    gelu = GELU(approximate="tanh")
+    output = gelu(mge.tensor(data))
+
+    np_output = (
+        0.5
+        * data
+        * (1 + np.tanh(np.sqrt(2 / np.pi) * (data + 0.044715 * np.power(data, 3))))
+    )
+    np.testing.assert_allclose(output.numpy(), np_output, rtol=1e-5, atol=1e-6)
+
+    int_data = data.astype(np.int32)
+    int_output = gelu(mge.tensor(int_data))
+    assert int_output.dtype == np.float32
+    np.testing.assert_allclose(
+        int_output.numpy(), gelu(mge.tensor(int_data.astype(np.float32))).numpy()
+    )
+
+
+def test_prelu():
+    data = np.random.normal(size=(2, 3, 4, 4)).astype(np.float32)
+
+    prelu = PReLU(3, init=0.1)
+    np.testing.assert_equal(
+        prelu.weight.numpy(), np.full((1, 3, 1, 1), 0.1, np.float32)
+    )
+    output = prelu(mge.tensor(data))
+
+    np_output = np.maximum(0, data) + np.float32(0.1) * np.minimum(0, data)
+    np.testing.assert_allclose(output.numpy(), np_output, rtol=1e-6)
+
+    prelu = PReLU()
+    assert prelu.weight.shape == (1,)
+    output = prelu(mge.tensor(data))
+    np_output = np.maximum(0, data) + np.float32(0.25) * np.minimum(0, data)
+    np.testing.assert_allclose(output.numpy(), np_output, rtol=1e-6)
+
+
+def test_softmax():
+    data = np.random.normal(size=(2, 3, 4, 5)).astype(np.float32)
+
+    def np_softmax(x, axis):
+        x = np.exp(x - x.max(axis=axis, keepdims=True))
+        return x / x.sum(axis=axis, keepdims=True)
+
+    for axis, expected_axis in [(None, 1), (-1, 3), (2, 2)]:
+        output = Softmax(axis)(mge.tensor(data))
+        np.testing.assert_allclose(
+            output.numpy(), np_softmax(data, expected_axis), rtol=1e-5, atol=1e-6
+        )
+
+    softmax = Softmax(-1)
+    softmax.axis = 2
+    np.testing.assert_allclose(
+        softmax(mge.tensor(data)).numpy(), np_softmax(data, 2), rtol=1e-5, atol=1e-6
+    )
+
+    int_data = np.array([[1, 2, 3], [-1, 0, 4]], dtype=np.int32)
+    output = Softmax(-1)(mge.tensor(int_data))
+    assert output.dtype == np.float32
+    np.testing.assert_allclose(
+        output.numpy(), np_softmax(int_data.astype(np.float32), 1), rtol=1e-5
+    )
+
+
+def test_softmax_grad():
+    data = np.random.normal(size=(4, 10)).astype(np.float32)
+    diff = np.random.normal(size=(4, 10)).astype(np.float32)
+
+    inp = mge.tensor(data)
+    with GradManager().attach(inp) as gm:
+        output = Softmax(-1)(inp)
+        gm.backward(output, mge.tensor(diff))
+
+    y = np.exp(data - data.max(axis=-1, keepdims=True))
+    y /= y.sum(axis=-1, keepdims=True)
+    np_grad = y * (diff - (diff * y).sum(axis=-1, keepdims=True))
+    np.testing.assert_allclose(inp.grad.numpy(), np_grad, rtol=1e-5, atol=1e-6)
+
+
+def test_prelu_grad():
+    data = np.random.normal(size=(2, 3, 4, 4)).astype(np.float32)
+    diff = np.random.normal(size=(2, 3, 4, 4)).astype(np.float32)
+
+    prelu = PReLU(3, init=0.1)
+    inp = mge.tensor(data)
+    with GradManager().attach([inp, prelu.weight]) as gm:
+        output = prelu(inp)
+        gm.backward(output, mge.tensor(diff))
+
+    np.testing.assert_allclose(
+        inp.grad.numpy(), np.where(data > 0, 1, np.float32(0.1)) * diff, rtol=1e-6
+    )
+    np.testing.assert_allclose(
+        prelu.weight.grad.numpy(),
+        (np.minimum(data, 0) * diff).sum(axis=(0, 2, 3), keepdims=True),
+        rtol=1e-5,
+        atol=1e-6,
+    )
+
+
+def test_prelu_float16():
+    data = np.random.normal(size=(2, 3, 4, 4)).astype(np.float16)
+
+    prelu = PReLU(3, init=0.1)
+    output = prelu(mge.tensor(data))
+
+    assert output.dtype == np.float16
+    assert prelu.weight.dtype == np.float32
+    np_output = np.maximum(0, data) + np.float16(0.1) * np.minimum(0, data)
+    np.testing.assert_allclose(output.numpy(), np_output, rtol=1e-3, atol=1e-3)
+
+
+def test_half_precision_activations():
+    data = np.random.normal(size=(4, 16)).astype(np.float32)
+    inp = mge.tensor(data.astype(np.float16))
+
+    for module in [Softmax(-1), GELU(approximate="tanh")]:
+        output = module(inp)
+        expected = module(mge.tensor(data)).numpy()
+        assert output.dtype == np.float16
+        np.testing.assert_allclose(output.numpy(), expected, rtol=1e-2, atol=1e-3)
+
+        with amp.autocast():
+            output = module(inp)
+        assert output.dtype == np.float32
+        np.testing.assert_allclose(output.numpy(), expected, rtol=1e-2, atol=1e-3)
+
+
+def test_relu_quantized():
+    data = np.random.normal(size=(3, 3)).astype(np.float32)
+    scale = np.float32(0.05)
+
+    inp = mge.tensor(data).astype(dtype.qint8(scale))
+    output = ReLU()(inp)
+
+    assert dtype.is_quantize(output.dtype)
+    np.testing.assert_equal(output.numpy(), np.maximum(inp.numpy(), 0))
+
+
+def test_activation_kind():
+    for module_type, kind in [
+        (ReLU, "relu"),
+        (SiLU, "silu"),
+        (GELU, "gelu"),
+        (PReLU, "prelu"),
+        (LeakyReLU, "leaky_relu"),
+        (ELU, "elu"),
+        (Softmax, "softmax"),
+    ]:
+        assert module_type.ACTIVATION_KIND == kind
+        assert module_type().ACTIVATION_KIND == kind
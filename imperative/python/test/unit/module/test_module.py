@@ -20,17 +20,23 @@ from megengine.module import (
     BatchNorm2d,
     Conv1d,
     Conv2d,
+    ConvRelu2d,
     Dropout,
     Linear,
     MaxPool2d,
     Module,
+    ReLU,
     Sequential,
     Softmax,
 )
 from megengine.module.module import _access_structure
 from megengine.quantization.quantize import quantize, quantize_qat
 from megengine.traced_module import TracedModule, trace_module
-from megengine.utils.module_utils import get_expand_structure, set_expand_structure
+from megengine.utils.module_utils import (
+    fuse_activation,
+    get_expand_structure,
+    set_expand_structure,
+)
 
 
 class MLP(Module):
@@ -279,6 +285,37 @@ def test_expand_structure():
         assert get_expand_structure(m, item[0]) == "TEST_VALUE"
 
 
+def test_fuse_activation():
+    net = Sequential(Conv2d(3, 4, 3, padding=1), ReLU(), Conv2d(4, 4, 1), Softmax())
+    data = tensor(np.random.random((2, 3, 8, 8)).astype(np.float32))
+    expected = net(data).numpy()
+    state = net.state_dict()
+
+    fuse_activation(net)
+    assert len(net) == 3
+    assert type(net[0]) is ConvRelu2d
+    assert type(net[1]) is Conv2d
+    assert net.layer_keys == ["0", "2", "3"]
+    assert net.state_dict().keys() == state.keys()
+    np.testing.assert_allclose(net(data).numpy(), expected, atol=1e-6)
+
+
+def test_fuse_activation_with_hooks():
+    def hook(module, inputs, outputs):
+        called.append(module)
+
+    called = []
+    net = Sequential(Conv2d(3, 4, 3), ReLU(), Conv2d(4, 4, 3), ReLU())
+    net[1].register_forward_hook(hook)
+    net[2].register_forward_pre_hook(lambda module, inputs: None)
+
+    fuse_activation(net)
+    assert len(net) == 4
+    assert [type(m) for m in net] == [Conv2d, ReLU, Conv2d, ReLU]
+    net(tensor(np.random.random((2, 3, 8, 8)).astype(np.float32)))
+    assert called == [net[1]]
+
+
 def test_flatten_others():
     def be_others(obj):
         return not isinstance(obj, (Tensor, Module))